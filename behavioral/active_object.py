@@ -1,6 +1,19 @@
-import threading
+import functools
+import heapq
+import itertools
+import logging
+import logging.handlers
+import math
+import os
 import queue
+import threading
 import time
+from types import MappingProxyType
+
+_SENTINEL = object()  # Marks a Future whose result has not been set yet
+_EMPTY = MappingProxyType({})  # Shared read-only kwargs for requests without any
+
+logger = logging.getLogger(__name__)
 
 class Future:
     """
@@ -10,23 +23,43 @@ class Future:
     ----------
     _result : Any
         The result of the asynchronous operation.
-    _condition : threading.Condition
-        Condition variable to manage thread synchronization.
+    _exception : BaseException or None
+        The exception raised by the operation, if it failed.
+    _event : threading.Event
+        Event that is set once the result is available.
+    _free_list : list or None
+        The free list this Future is returned to by `recycle`, if any.
+    _pooled : bool
+        Whether the Future has been recycled and not handed out again since.
 
     Methods
     -------
     set_result(result)
         Sets the result of the operation and notifies waiting threads.
+    set_exception(exception)
+        Records that the operation failed and notifies waiting threads.
     get_result()
         Waits for and returns the result of the operation.
+    recycle()
+        Resets the Future and returns it to its free list for reuse.
     """
 
-    def __init__(self):
+    __slots__ = ('_result', '_exception', '_event', '_free_list', '_pooled')
+
+    def __init__(self, free_list=None):
         """
-        Initializes the Future object with no result and a condition variable.
+        Initializes the Future object with no result and an unset event.
+
+        Parameters
+        ----------
+        free_list : list, optional
+            The free list to return this Future to when it is recycled (default is None).
         """
-        self._result = None
-        self._condition = threading.Condition()
+        self._result = _SENTINEL
+        self._exception = None
+        self._event = threading.Event()
+        self._free_list = free_list
+        self._pooled = False
 
     def set_result(self, result):
         """
@@ -37,9 +70,20 @@ class Future:
         result : Any
             The result to be set and retrieved later by `get_result`.
         """
-        with self._condition:
-            self._result = result
-            self._condition.notify_all()
+        self._result = result
+        self._event.set()
+
+    def set_exception(self, exception):
+        """
+        Records the exception raised by the operation and notifies all waiting threads.
+
+        Parameters
+        ----------
+        exception : BaseException
+            The exception to be raised by `get_result`.
+        """
+        self._exception = exception
+        self._event.set()
 
     def get_result(self):
         """
@@ -49,11 +93,39 @@ class Future:
         -------
         Any
             The result of the operation.
+
+        Raises
+        ------
+        BaseException
+            The exception raised by the operation, if it failed.
         """
-        with self._condition:
-            while self._result is None:
-                self._condition.wait()
-            return self._result
+        self._event.wait()
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def recycle(self):
+        """
+        Resets the Future and returns it to the free list it was allocated from.
+
+        Call this only after `get_result` has returned and once no reference to
+        the Future is kept, since the Proxy will hand it out for a later call.
+
+        Raises
+        ------
+        RuntimeError
+            If the result has not been set yet, or the Future was already recycled.
+        """
+        if self._pooled:
+            raise RuntimeError('Future has already been recycled')
+        if not self._event.is_set():
+            raise RuntimeError('cannot recycle a Future before its result is set')
+        self._pooled = True
+        if self._free_list is not None:
+            self._result = _SENTINEL
+            self._exception = None
+            self._event.clear()
+            self._free_list.append(self)
 
 class MethodRequest:
     """
@@ -61,10 +133,8 @@ class MethodRequest:
 
     Attributes
     ----------
-    servant : Any
-        The target object on which the method is to be executed.
     method : callable
-        The method to be executed.
+        The method to be executed, bound to the servant.
     args : tuple
         The positional arguments for the method.
     kwargs : dict
@@ -73,85 +143,204 @@ class MethodRequest:
         The priority of the method request (higher value means higher priority).
     future : Future
         Future object to hold the result of the method execution.
+    _free_list : list or None
+        The free list this MethodRequest is returned to by `release`, if any.
 
     Methods
     -------
     execute()
         Executes the method on the servant and stores the result in the Future.
+    release()
+        Clears the MethodRequest and returns it to its free list for reuse.
     """
 
-    def __init__(self, servant, method, args=(), kwargs={}, priority=0):
+    __slots__ = ('method', 'args', 'kwargs', 'priority', 'future', '_free_list')
+
+    def __init__(self, method, args=(), kwargs=None, priority=0, future=None, free_list=None):
         """
-        Initializes the MethodRequest with the target servant, method, arguments, and priority.
+        Initializes the MethodRequest with the bound servant method, arguments, and priority.
 
         Parameters
         ----------
-        servant : Any
-            The target object on which the method is to be executed.
         method : callable
-            The method to be executed.
+            The method to be executed, bound to the servant (e.g. `servant.process_transaction`).
         args : tuple, optional
             The positional arguments for the method (default is ()).
         kwargs : dict, optional
-            The keyword arguments for the method (default is {}).
+            The keyword arguments for the method (default is None, meaning no keyword arguments).
         priority : int, optional
             The priority of the method request (default is 0).
+        future : Future, optional
+            The Future to store the result in (default is a new Future).
+        free_list : list, optional
+            The free list to return this MethodRequest to when it is released (default is None).
         """
-        self.servant = servant
         self.method = method
         self.args = args
-        self.kwargs = kwargs
+        self.kwargs = kwargs or _EMPTY
         self.priority = priority
-        self.future = Future()
+        self.future = future if future is not None else Future()
+        self._free_list = free_list
 
     def execute(self):
         """
         Executes the method on the servant and stores the result in the Future.
-        """
-        result = self.method(self.servant, *self.args, **self.kwargs)
-        self.future.set_result(result)
 
-    def __lt__(self, other):
+        If the method raises, the exception is stored in the Future instead,
+        so it reaches the caller through `get_result` rather than the worker.
         """
-        Compares MethodRequest objects based on priority for use in a priority queue.
-
-        Parameters
-        ----------
-        other : MethodRequest
-            Another MethodRequest object to compare with.
+        try:
+            if self.kwargs:
+                result = self.method(*self.args, **self.kwargs)
+            else:
+                result = self.method(*self.args)
+        except Exception as exc:
+            self.future.set_exception(exc)
+        else:
+            self.future.set_result(result)
+
+    def release(self):
+        """
+        Drops the per-call references held by an executed MethodRequest and
+        returns it to the free list it was allocated from.
 
-        Returns
-        -------
-        bool
-            True if this object's priority is higher than the other.
+        The method is kept: a free list belongs to one Proxy, so a reused
+        request always targets the same call.
         """
-        return self.priority > other.priority  # Higher priority first
+        if self._free_list is not None:
+            self.args = ()
+            self.kwargs = _EMPTY
+            self.future = None
+            self._free_list.append(self)
 
-class Scheduler(threading.Thread):
+# Queued once per worker by BaseScheduler.shutdown; ranks below every real request
+_STOP = MethodRequest(None, priority=-math.inf)
+
+class BaseScheduler:
     """
-    Scheduler that manages the execution of MethodRequests using a priority queue.
+    Base class for schedulers that execute MethodRequests on a fixed pool of
+    daemon worker threads.
+
+    Subclasses own the activation queue. They implement `enqueue`,
+    `enqueue_many`, `_get`, which blocks until a request can be taken, and
+    `_close`, which sets `_shutdown` and queues one stop request per worker
+    behind the pending work. Both the enqueue methods and `_close` read or
+    set `_shutdown` under the queue's lock, so no request can be queued
+    behind the stop requests. They create their queue before calling
+    `_start_workers`.
 
     Attributes
     ----------
-    activation_queue : queue.PriorityQueue
-        A priority queue to store and order MethodRequest objects.
+    num_workers : int
+        The number of threads consuming the activation queue.
+    _workers : list of threading.Thread
+        The worker threads.
+    _shutdown : bool
+        Whether `shutdown` has been called; enqueueing then raises RuntimeError.
 
     Methods
     -------
     enqueue(method_request)
         Adds a MethodRequest to the activation queue.
-    run()
-        Continuously processes MethodRequests from the activation queue.
+    enqueue_many(method_requests)
+        Adds several MethodRequests to the activation queue at once.
+    shutdown()
+        Stops the workers once the queued requests have been processed.
     """
 
-    def __init__(self):
+    def __init__(self, num_workers=None):
+        """
+        Initializes the worker pool settings; the workers start in `_start_workers`.
+
+        Parameters
+        ----------
+        num_workers : int, optional
+            The number of threads processing requests (default is `os.cpu_count()`).
+        """
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self._workers = []
+        self._shutdown = False
+
+    def _start_workers(self):
         """
-        Initializes the Scheduler and starts it as a daemon thread.
+        Starts the worker threads; called by subclasses once their queue exists.
         """
-        super().__init__()
-        self.activation_queue = queue.PriorityQueue()
-        self.daemon = True  # Allows the thread to be killed when the main thread exits
-        self.start()
+        # Daemon threads let the process exit even if shutdown() is never called
+        self._workers = [threading.Thread(target=self._worker_loop, daemon=True)
+                         for _ in range(self.num_workers)]
+        for worker in self._workers:
+            worker.start()
+
+    def enqueue(self, method_request):
+        raise NotImplementedError
+
+    def enqueue_many(self, method_requests):
+        raise NotImplementedError
+
+    def _get(self):
+        raise NotImplementedError
+
+    def _close(self):
+        raise NotImplementedError
+
+    def _worker_loop(self):
+        """
+        Continuously processes MethodRequests from the activation queue until stopped.
+        """
+        while True:
+            method_request = self._get()
+            if method_request is _STOP:
+                return
+            try:
+                method_request.execute()
+            except Exception:
+                # execute() routes servant errors to the Future; anything else must not kill the worker
+                logger.exception("Unexpected error while executing %r", method_request)
+            finally:
+                method_request.release()
+
+    def shutdown(self):
+        """
+        Stops the workers once the requests already enqueued have been processed,
+        and waits for them to exit.
+
+        Requests enqueued afterwards are rejected with RuntimeError. Calling
+        `shutdown` again has no further effect.
+        """
+        self._close()
+        for worker in self._workers:
+            worker.join()
+
+class Scheduler(BaseScheduler):
+    """
+    Scheduler that manages the execution of MethodRequests using a priority queue.
+
+    Attributes
+    ----------
+    _heap : list
+        A heap of `(-priority, sequence, method_request)` tuples, so the heap
+        compares plain tuples. Requests of equal priority are dequeued in
+        submission order; with several workers they may still finish out of order.
+    _counter : itertools.count
+        Source of the sequence numbers used to break priority ties.
+    _cv : threading.Condition
+        Condition variable guarding `_heap` and signalling new requests.
+    """
+
+    def __init__(self, num_workers=None):
+        """
+        Initializes the Scheduler and starts its worker threads.
+
+        Parameters
+        ----------
+        num_workers : int, optional
+            The number of threads processing requests (default is `os.cpu_count()`).
+        """
+        super().__init__(num_workers)
+        self._heap = []
+        self._counter = itertools.count()
+        self._cv = threading.Condition()
+        self._start_workers()
 
     def enqueue(self, method_request):
         """
@@ -162,15 +351,61 @@ class Scheduler(threading.Thread):
         method_request : MethodRequest
             The MethodRequest object to be enqueued.
         """
-        self.activation_queue.put(method_request)
+        with self._cv:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new requests after shutdown')
+            heapq.heappush(self._heap, (-method_request.priority, next(self._counter), method_request))
+            self._cv.notify()  # Wake a single idle worker
 
-    def run(self):
+    def enqueue_many(self, method_requests):
         """
-        Continuously processes MethodRequests from the activation queue.
+        Adds several MethodRequests to the activation queue, taking the lock
+        only once for the whole batch.
+
+        Parameters
+        ----------
+        method_requests : list of MethodRequest
+            The MethodRequest objects to be enqueued.
         """
-        while True:
-            method_request = self.activation_queue.get()
-            method_request.execute()
+        if not method_requests:
+            return
+        counter = self._counter
+        entries = [(-method_request.priority, next(counter), method_request)
+                   for method_request in method_requests]
+        with self._cv:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new requests after shutdown')
+            heap = self._heap
+            if len(entries) > len(heap):
+                # Re-heapifying is linear, cheaper than pushing a large batch one by one
+                heap.extend(entries)
+                heapq.heapify(heap)
+            else:
+                for entry in entries:
+                    heapq.heappush(heap, entry)
+            self._cv.notify(len(entries))
+
+    def _get(self):
+        """
+        Blocks until a request is available and removes the highest-priority one.
+        """
+        with self._cv:
+            while not self._heap:
+                self._cv.wait()
+            _, _, method_request = heapq.heappop(self._heap)
+            return method_request
+
+    def _close(self):
+        """
+        Marks the scheduler as shut down and queues one stop request per worker.
+        """
+        with self._cv:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            for _ in range(self.num_workers):
+                heapq.heappush(self._heap, (-_STOP.priority, next(self._counter), _STOP))
+            self._cv.notify_all()
 
 class TransactionProcessor:
     """
@@ -198,7 +433,9 @@ class TransactionProcessor:
         str
             A confirmation message indicating the transaction is complete.
         """
-        print(f"Processing transaction {transaction_id} for amount ${amount}...")
+        # Logged rather than printed so workers do not contend on the stdout lock;
+        # attach a QueueHandler to move the actual I/O to a background thread.
+        logger.debug("Processing transaction %s for amount $%s...", transaction_id, amount)
         time.sleep(2)  # Simulate a time-consuming transaction
         return f"Transaction {transaction_id} completed for ${amount}."
 
@@ -212,11 +449,19 @@ class Proxy:
         The scheduler responsible for managing and executing MethodRequests.
     servant : TransactionProcessor
         The servant that processes transactions.
+    _new_request : functools.partial
+        MethodRequest constructor with the servant's bound method already applied.
+    _local : threading.local
+        Per-thread free lists of MethodRequest and Future objects. Worker and
+        client threads append released objects back with the GIL-atomic
+        `list.append`; only the owning thread pops from them.
 
     Methods
     -------
     process_transaction(transaction_id, amount, priority=0)
         Submits a transaction processing request to the scheduler.
+    process_transactions(transactions)
+        Submits several transaction processing requests to the scheduler at once.
     """
 
     def __init__(self, scheduler, servant):
@@ -232,6 +477,19 @@ class Proxy:
         """
         self.scheduler = scheduler
         self.servant = servant
+        self._new_request = functools.partial(MethodRequest, servant.process_transaction)
+        self._local = threading.local()
+
+    def _free_lists(self):
+        """
+        Returns the calling thread's MethodRequest and Future free lists.
+        """
+        local = self._local
+        try:
+            return local.requests, local.futures
+        except AttributeError:
+            local.requests, local.futures = [], []
+            return local.requests, local.futures
 
     def process_transaction(self, transaction_id, amount, priority=0):
         """
@@ -250,14 +508,67 @@ class Proxy:
         -------
         Future
             A Future object to retrieve the result of the transaction processing.
+            Call its `recycle` method once done with it to let it be reused.
         """
-        method_request = MethodRequest(self.servant, TransactionProcessor.process_transaction, 
-                                       (transaction_id, amount), priority=priority)
+        requests, futures = self._free_lists()
+        method_request = self._make_request(requests, futures, transaction_id, amount, priority)
+        future = method_request.future  # Read before a worker can execute and release the request
         self.scheduler.enqueue(method_request)
-        return method_request.future
+        return future
+
+    def process_transactions(self, transactions):
+        """
+        Submits several transaction processing requests to the scheduler at once.
+
+        All requests are built before the scheduler is touched, and then handed
+        over in a single `enqueue_many` call.
+
+        Parameters
+        ----------
+        transactions : iterable of (str, float, int)
+            The `(transaction_id, amount, priority)` of each transaction.
+
+        Returns
+        -------
+        list of Future
+            Future objects to retrieve the results, in submission order.
+        """
+        requests, futures = self._free_lists()
+        method_requests = [self._make_request(requests, futures, transaction_id, amount, priority)
+                           for transaction_id, amount, priority in transactions]
+        # Collect the futures before a worker can execute and release the requests
+        batch_futures = [method_request.future for method_request in method_requests]
+        self.scheduler.enqueue_many(method_requests)
+        return batch_futures
+
+    def _make_request(self, requests, futures, transaction_id, amount, priority):
+        """
+        Builds a MethodRequest, reusing objects from the given free lists when possible.
+        """
+        if futures:
+            future = futures.pop()
+            future._pooled = False
+        else:
+            future = Future(futures)
+        if not requests:
+            return self._new_request((transaction_id, amount), priority=priority, future=future,
+                                     free_list=requests)
+        # A recycled request already targets this Proxy's servant method
+        method_request = requests.pop()
+        method_request.args = (transaction_id, amount)
+        method_request.priority = priority
+        method_request.future = future
+        return method_request
 
 # Example usage
 if __name__ == "__main__":
+    # Drain log records on a background listener thread, off the worker hot path
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.DEBUG)
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    listener.start()
+
     transaction_processor = TransactionProcessor()
     scheduler = Scheduler()
     proxy = Proxy(scheduler, transaction_processor)
@@ -271,6 +582,9 @@ if __name__ == "__main__":
     print("System is processing transactions while you do other tasks...")
 
     # Retrieve results
-    print(future_high.get_result())
-    print(future_medium.get_result())
-    print(future_low.get_result())
+    for future in (future_high, future_medium, future_low):
+        print(future.get_result())
+        future.recycle()  # Lets the proxy reuse the Future for later calls
+
+    scheduler.shutdown()
+    listener.stop()
@@ -1,14 +1,105 @@
+import math
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # Numba is optional; compute_areas then falls back to NumPy
+    numba = None
+
+# Shape kinds stored in ShapeBatch.kinds
+KIND_CIRCLE = 0
+KIND_SQUARE = 1
+KIND_TRIANGLE = 2
+
+# Dispatch table for visitors that do not derive from Visitor: they visit nothing
+_NO_DISPATCH = {}
+
+if numba is not None:
+    # Pinning the signature compiles eagerly and cache=True stores the machine
+    # code on disk, so the first batch does not pay the JIT compilation cost.
+    @numba.njit('f8[:](i1[:], f8[:], f8[:])', parallel=True, fastmath=True, cache=True)
+    def _area_kernel(kinds, a, b):
+        n = kinds.shape[0]
+        areas = np.empty(n)
+        for i in numba.prange(n):
+            kind = kinds[i]
+            if kind == KIND_CIRCLE:
+                areas[i] = math.pi * a[i] * a[i]
+            elif kind == KIND_SQUARE:
+                areas[i] = a[i] * a[i]
+            else:
+                areas[i] = 0.5 * a[i] * b[i]
+        return areas
+else:
+    def _area_kernel(kinds, a, b):
+        # Work in place on a single output array to avoid one temporary per shape kind
+        # Like the Numba kernel, every kind other than circle and square uses the triangle formula
+        areas = np.multiply(a, a)
+        circles = kinds == KIND_CIRCLE
+        np.multiply(areas, math.pi, out=areas, where=circles)
+        triangles = ~(circles | (kinds == KIND_SQUARE))
+        np.multiply(a, b, out=areas, where=triangles)
+        np.multiply(areas, 0.5, out=areas, where=triangles)
+        return areas
+
+
+def compute_areas(kinds, a, b):
+    """
+    Computes the areas of a batch of shapes stored as parallel arrays.
+
+    The inputs are converted to the int8/float64 contiguous arrays the kernel
+    is compiled for, so the result does not depend on whether Numba is installed.
+
+    Parameters
+    ----------
+    kinds : array_like of int
+        The kind of each shape (KIND_CIRCLE, KIND_SQUARE or KIND_TRIANGLE).
+    a : array_like of float
+        The radius, side or base of each shape.
+    b : array_like of float
+        The height of each triangle (ignored for circles and squares).
+
+    Returns
+    -------
+    np.ndarray of float64
+        The area of each shape.
+    """
+    return _area_kernel(np.ascontiguousarray(kinds, dtype=np.int8),
+                        np.ascontiguousarray(a, dtype=np.float64),
+                        np.ascontiguousarray(b, dtype=np.float64))
+
+
 class GraphicElement:
     """
     Abstract base class for graphic elements.
 
+    Dispatch looks up the element's type in the visitor's `_dispatch` table.
+    On a miss, the element's base classes are tried in MRO order, so
+    subclasses of an element are visited like their parent. The outcome is
+    cached in the table, which makes the next lookup a single dict access.
+    Visitors silently ignore elements they cannot visit. Objects that are
+    not Visitor subclasses have no table and are ignored as well.
+
     Methods
     -------
     accept(visitor)
         Accepts a visitor that performs an operation on the element.
     """
     def accept(self, visitor):
-        pass
+        dispatch = getattr(visitor, '_dispatch', _NO_DISPATCH)
+        element_type = type(self)
+        method_name = dispatch.get(element_type, _NO_DISPATCH)
+        if method_name is _NO_DISPATCH:
+            method_name = None
+            for base in element_type.__mro__[1:]:
+                if base in dispatch:
+                    method_name = dispatch[base]
+                    break
+            if dispatch is not _NO_DISPATCH:
+                dispatch[element_type] = method_name
+        if method_name is not None:
+            return getattr(visitor, method_name)(self)
 
 
 class Circle(GraphicElement):
@@ -28,10 +119,6 @@ class Circle(GraphicElement):
     def __init__(self, radius):
         self.radius = radius
 
-    def accept(self, visitor):
-        if isinstance(visitor, CircleVisitor):
-            visitor.visit_circle(self)
-
 
 class Square(GraphicElement):
     """
@@ -50,10 +137,6 @@ class Square(GraphicElement):
     def __init__(self, side):
         self.side = side
 
-    def accept(self, visitor):
-        if isinstance(visitor, SquareVisitor):
-            visitor.visit_square(self)
-
 
 class Triangle(GraphicElement):
     """
@@ -75,10 +158,117 @@ class Triangle(GraphicElement):
         self.base = base
         self.height = height
 
-    def accept(self, visitor):
-        if isinstance(visitor, TriangleVisitor):
-            visitor.visit_triangle(self)
-class CircleVisitor:
+
+class ShapeBatch(GraphicElement):
+    """
+    Concrete element holding many shapes as parallel arrays (structure of arrays).
+
+    Each shape occupies one slot in every array, which keeps the data compact
+    and lets visitors process the whole batch with a single vectorized call.
+
+    Attributes
+    ----------
+    kinds : np.ndarray of int8
+        The kind of each shape (KIND_CIRCLE, KIND_SQUARE or KIND_TRIANGLE).
+    a : np.ndarray of float64
+        The radius of each circle, side of each square or base of each triangle.
+    b : np.ndarray of float64
+        The height of each triangle (zero for circles and squares).
+
+    Methods
+    -------
+    add_circle(radius)
+        Appends a circle to the batch.
+    add_square(side)
+        Appends a square to the batch.
+    add_triangle(base, height)
+        Appends a triangle to the batch.
+    accept(visitor)
+        Accepts a visitor that performs an operation on the whole batch.
+    """
+    def __init__(self, capacity=16):
+        self._kinds = np.empty(capacity, dtype=np.int8)
+        self._a = np.empty(capacity, dtype=np.float64)
+        self._b = np.empty(capacity, dtype=np.float64)
+        self._size = 0
+
+    @property
+    def kinds(self):
+        return self._kinds[:self._size]
+
+    @property
+    def a(self):
+        return self._a[:self._size]
+
+    @property
+    def b(self):
+        return self._b[:self._size]
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        """
+        Yields the shapes as Circle, Square and Triangle objects.
+
+        Sizes are stored as float64, so they are yielded as floats.
+        """
+        for kind, a, b in zip(self.kinds.tolist(), self.a.tolist(), self.b.tolist()):
+            if kind == KIND_CIRCLE:
+                yield Circle(a)
+            elif kind == KIND_SQUARE:
+                yield Square(a)
+            else:
+                yield Triangle(a, b)
+
+    def _append(self, kind, a, b=0.0):
+        if self._size == len(self._kinds):
+            capacity = max(1, 2 * self._size)  # Grow geometrically to amortize copies
+            self._kinds = np.resize(self._kinds, capacity)
+            self._a = np.resize(self._a, capacity)
+            self._b = np.resize(self._b, capacity)
+        self._kinds[self._size] = kind
+        self._a[self._size] = a
+        self._b[self._size] = b
+        self._size += 1
+
+    def add_circle(self, radius):
+        self._append(KIND_CIRCLE, radius)
+
+    def add_square(self, side):
+        self._append(KIND_SQUARE, side)
+
+    def add_triangle(self, base, height):
+        self._append(KIND_TRIANGLE, base, height)
+
+
+class Visitor:
+    """
+    Base class for all visitors.
+
+    Attributes
+    ----------
+    _dispatch : dict
+        Maps each element type the visitor can handle to the name of its visit
+        method. Every interface declares only its own entry; the tables of all
+        base classes are merged when a subclass is created. `accept` also
+        caches the lookups for element subclasses here.
+    _declared_dispatch : dict
+        The entries the class itself declared, kept apart from the merged
+        table so that cached lookups never leak into subclasses.
+    """
+    _dispatch = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._declared_dispatch = cls.__dict__.get('_dispatch', {})
+        dispatch = {}
+        for base in reversed(cls.__mro__):
+            dispatch.update(base.__dict__.get('_declared_dispatch', {}))
+        cls._dispatch = dispatch
+
+
+class CircleVisitor(Visitor):
     """
     Interface for visitors that can visit a Circle.
 
@@ -87,11 +277,13 @@ class CircleVisitor:
     visit_circle(circle)
         Visits a circle element.
     """
+    _dispatch = {Circle: 'visit_circle'}
+
     def visit_circle(self, circle):
-        pass
+        raise NotImplementedError
 
 
-class SquareVisitor:
+class SquareVisitor(Visitor):
     """
     Interface for visitors that can visit a Square.
 
@@ -100,11 +292,13 @@ class SquareVisitor:
     visit_square(square)
         Visits a square element.
     """
+    _dispatch = {Square: 'visit_square'}
+
     def visit_square(self, square):
-        pass
+        raise NotImplementedError
 
 
-class TriangleVisitor:
+class TriangleVisitor(Visitor):
     """
     Interface for visitors that can visit a Triangle.
 
@@ -113,9 +307,26 @@ class TriangleVisitor:
     visit_triangle(triangle)
         Visits a triangle element.
     """
+    _dispatch = {Triangle: 'visit_triangle'}
+
     def visit_triangle(self, triangle):
-        pass
-class RenderVisitor(CircleVisitor, SquareVisitor, TriangleVisitor):
+        raise NotImplementedError
+
+
+class ShapeBatchVisitor(Visitor):
+    """
+    Interface for visitors that can visit a ShapeBatch.
+
+    Methods
+    -------
+    visit_batch(batch)
+        Visits a batch of shapes.
+    """
+    _dispatch = {ShapeBatch: 'visit_batch'}
+
+    def visit_batch(self, batch):
+        raise NotImplementedError
+class RenderVisitor(CircleVisitor, SquareVisitor, TriangleVisitor, ShapeBatchVisitor):
     """
     Concrete visitor for rendering graphic elements.
 
@@ -127,6 +338,8 @@ class RenderVisitor(CircleVisitor, SquareVisitor, TriangleVisitor):
         Renders a square.
     visit_triangle(triangle)
         Renders a triangle.
+    visit_batch(batch)
+        Renders every shape in a batch.
     """
 
     def visit_circle(self, circle):
@@ -138,8 +351,12 @@ class RenderVisitor(CircleVisitor, SquareVisitor, TriangleVisitor):
     def visit_triangle(self, triangle):
         print(f"Rendering a triangle with base {triangle.base} and height {triangle.height}.")
 
+    def visit_batch(self, batch):
+        for element in batch:
+            element.accept(self)
+
 
-class AreaCalculationVisitor(CircleVisitor, SquareVisitor, TriangleVisitor):
+class AreaCalculationVisitor(CircleVisitor, SquareVisitor, TriangleVisitor, ShapeBatchVisitor):
     """
     Concrete visitor for calculating the area of graphic elements.
 
@@ -151,25 +368,44 @@ class AreaCalculationVisitor(CircleVisitor, SquareVisitor, TriangleVisitor):
         Calculates the area of a square.
     visit_triangle(triangle)
         Calculates the area of a triangle.
+    visit_batch(batch)
+        Calculates the areas of every shape in a batch.
     """
 
     def visit_circle(self, circle):
-        area = 3.14159 * (circle.radius ** 2)
+        area = math.pi * circle.radius * circle.radius
         print(f"Area of the circle: {area:.2f}")
 
     def visit_square(self, square):
-        area = square.side ** 2
+        area = square.side * square.side
         print(f"Area of the square: {area:.2f}")
 
     def visit_triangle(self, triangle):
         area = 0.5 * triangle.base * triangle.height
         print(f"Area of the triangle: {area:.2f}")
-        
+
+    def visit_batch(self, batch):
+        """
+        Calculates the areas of every shape in a batch with one vectorized call.
+
+        Parameters
+        ----------
+        batch : ShapeBatch
+            The shapes whose areas are calculated.
+
+        Returns
+        -------
+        np.ndarray of float64
+            The area of each shape, in insertion order.
+        """
+        return compute_areas(batch.kinds, batch.a, batch.b)
+
 if __name__ == "__main__":
     # Create some graphic elements
-    circle = Circle(radius=5)
-    square = Square(side=4)
-    triangle = Triangle(base=3, height=6)
+    batch = ShapeBatch()
+    batch.add_circle(radius=5)
+    batch.add_square(side=4)
+    batch.add_triangle(base=3, height=6)
 
     # Create visitors
     render_visitor = RenderVisitor()
@@ -177,12 +413,9 @@ if __name__ == "__main__":
 
     # Apply the RenderVisitor
     print("Rendering elements:")
-    circle.accept(render_visitor)
-    square.accept(render_visitor)
-    triangle.accept(render_visitor)
+    batch.accept(render_visitor)
 
     # Apply the AreaCalculationVisitor
     print("\nCalculating areas:")
-    circle.accept(area_visitor)
-    square.accept(area_visitor)
-    triangle.accept(area_visitor)
\ No newline at end of file
+    for element, area in zip(batch, batch.accept(area_visitor)):
+        print(f"Area of the {type(element).__name__.lower()}: {area:.2f}")